@@ -1,37 +1,147 @@
 # log_parser.py
 
+import asyncio
+import os
+import re
 import subprocess
+import threading
 from datetime import datetime
 from loguru import logger
 
+_ERROR_RE = re.compile(rb'error', re.IGNORECASE)
+
+try:
+    from cysystemd.reader import JournalReader, JournalOpenMode, Rule
+except ImportError:
+    JournalReader = None  # Fall back to spawning journalctl
+
+def _error_priority_rule():
+    """
+    Builds a rule matching priorities err and above, like `journalctl -p err`.
+    """
+    rule = Rule("PRIORITY", "0")
+    for priority in ("1", "2", "3"):
+        rule = rule | Rule("PRIORITY", priority)
+    return rule
+
+# Persistent journal readers, one per filter, opened on first use
+_journal_readers = {}
+_journal_readers_lock = threading.Lock()
+
+def _get_journal_reader(kind):
+    """
+    Returns the (reader, lock) pair for "kernel" or "system" error logs.
+    """
+    with _journal_readers_lock:
+        if kind not in _journal_readers:
+            rule = _error_priority_rule()
+            if kind == "kernel":
+                rule = rule & Rule("_TRANSPORT", "kernel")
+            reader = JournalReader()
+            reader.open(JournalOpenMode.SYSTEM)
+            reader.add_filter(rule)
+            # Requesting the fd sets up the inotify watches process_events() relies on
+            reader.fd
+            _journal_readers[kind] = (reader, threading.Lock())
+        return _journal_readers[kind]
+
+def _read_journal(kind, limit):
+    """
+    Reads the latest `limit` entries of a persistent reader straight from the journal.
+    """
+    reader, lock = _get_journal_reader(kind)
+    logs = []
+    # A journal context must not be used from two threads at once
+    with lock:
+        # Pick up new and rotated journal files before jumping to the tail
+        reader.process_events()
+        reader.seek_tail()
+        while len(logs) < limit:
+            entry = reader.previous()
+            if entry is None:
+                break
+            logs.append({
+                "timestamp": datetime.fromtimestamp(entry.get_realtime_sec()),
+                "message": entry.data.get("MESSAGE", ""),
+            })
+    # journalctl -n lists the oldest entry first, keep the same order
+    logs.reverse()
+    return logs
+
+# Example line format: "1694685600.123456 hostname kernel: Error message"
+# Anything else, like "-- No entries --", fails the match and is skipped
+_LINE_RE = re.compile(r'(\d+\.\d+) (.*)')
+
+def parse_journal_lines(lines):
+    """
+    Parses `journalctl -o short-unix` lines into timestamp/message dicts.
+    """
+    logs = []
+    for line in lines:
+        match = _LINE_RE.match(line)
+        if match:
+            ts_str, message = match.groups()
+            logs.append({"timestamp": datetime.fromtimestamp(float(ts_str)), "message": message})
+    return logs
+
+def _read_journalctl(args, timeout=10):
+    """
+    Runs journalctl with `-o short-unix` and parses its output as it streams in.
+    """
+    cmd = ['journalctl', *args, '-o', 'short-unix', '--no-pager']
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        timed_out = threading.Event()
+
+        def expire():
+            timed_out.set()
+            proc.kill()
+
+        # Reading stdout blocks, so the deadline is enforced by killing the process
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        try:
+            logs = parse_journal_lines(proc.stdout)
+            proc.wait(timeout=timeout)
+        finally:
+            # Never leave a hung journalctl behind; leaving the `with` block reaps it
+            timer.cancel()
+            proc.kill()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return logs
+
 def get_kernel_logs(limit=10):
     """
     Retrieves the latest kernel error logs.
     """
     try:
-        result = subprocess.run(['journalctl', '-k', '-p', 'err', '-n', str(limit)], capture_output=True, text=True, timeout=10)
-        logs = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                # Example line format: "Sep 14 10:00:00 hostname kernel: Error message"
-                parts = line.split(' ', 3)
-                if len(parts) >= 4:
-                    timestamp_str = ' '.join(parts[:3])
-                    message = parts[3]
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%b %d %H:%M:%S')
-                        # As journalctl logs may not include the year, default to current year
-                        timestamp = timestamp.replace(year=datetime.now().year)
-                    except ValueError:
-                        timestamp = datetime.now()
-                    logs.append({"timestamp": timestamp, "message": message})
-        return logs
+        if JournalReader is not None:
+            return _read_journal("kernel", limit)
+        return _read_journalctl(['-k', '-p', 'err', '-n', str(limit)])
     except subprocess.TimeoutExpired:
         logger.error("Timeout while retrieving kernel logs.")
     except Exception as e:
         logger.exception("Failed to retrieve kernel logs.")
     return []
 
+def _tail(path, n):
+    """
+    Returns the last `n` lines of a file as bytes without reading all of it.
+    """
+    if n <= 0:
+        return []
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        window = 64 * n
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).splitlines()
+            # Unless the window reached the start of the file, its first line is partial
+            if start == 0 or len(lines) > n:
+                return lines[-n:]
+            window *= 2
+
 def get_middleware_logs(limit=10):
     """
     Retrieves the latest middleware error logs.
@@ -42,9 +152,10 @@ def get_middleware_logs(limit=10):
     logs = {}
     for log_file in middleware_log_files:
         try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()[-limit:]
-                logs[log_file] = [line.strip() for line in lines if 'error' in line.lower()]
+            # Overfetch so the error filter can still yield `limit` entries
+            lines = _tail(log_file, limit * 4)
+            errors = [line.decode('utf-8', 'replace').strip() for line in lines if _ERROR_RE.search(line)]
+            logs[log_file] = errors[-limit:]
         except FileNotFoundError:
             logger.warning(f"Middleware log file not found: {log_file}")
         except Exception as e:
@@ -56,25 +167,22 @@ def get_system_logs(limit=10):
     Retrieves the latest system error logs.
     """
     try:
-        result = subprocess.run(['journalctl', '-p', 'err', '-n', str(limit)], capture_output=True, text=True, timeout=10)
-        logs = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                # Example line format: "Sep 14 10:00:00 hostname systemd: Error message"
-                parts = line.split(' ', 3)
-                if len(parts) >= 4:
-                    timestamp_str = ' '.join(parts[:3])
-                    message = parts[3]
-                    try:
-                        timestamp = datetime.strptime(timestamp_str, '%b %d %H:%M:%S')
-                        # As journalctl logs may not include the year, default to current year
-                        timestamp = timestamp.replace(year=datetime.now().year)
-                    except ValueError:
-                        timestamp = datetime.now()
-                    logs.append({"timestamp": timestamp, "message": message})
-        return logs
+        if JournalReader is not None:
+            return _read_journal("system", limit)
+        return _read_journalctl(['-p', 'err', '-n', str(limit)])
     except subprocess.TimeoutExpired:
         logger.error("Timeout while retrieving system logs.")
     except Exception as e:
         logger.exception("Failed to retrieve system logs.")
     return []
+
+async def get_all_logs(limit=10):
+    """
+    Retrieves kernel, middleware and system error logs concurrently.
+    Returns a (kernel_logs, middleware_logs, system_logs) tuple.
+    """
+    return tuple(await asyncio.gather(
+        asyncio.to_thread(get_kernel_logs, limit),
+        asyncio.to_thread(get_middleware_logs, limit),
+        asyncio.to_thread(get_system_logs, limit),
+    ))
@@ -1,16 +1,107 @@
 # system_dashboard.py
 
 import dash
-from dash import dcc, html
-from dash.dependencies import Output, Input, State  # Ensure State is imported
+from dash import dcc, html, Patch
+from dash.dependencies import Output, Input
 import plotly.graph_objs as go
 import psutil
-import datetime
+from loguru import logger
+import os
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+try:
+    from flask_caching import Cache
+except ImportError:
+    Cache = None
+
+# Interval between two samples, shared by the sampler and the browser refresh
+UPDATE_INTERVAL = 2  # in seconds
+HISTORY_LENGTH = 50
+DISK_CACHE_TTL = 30  # in seconds, disk usage changes slowly
 
 app = dash.Dash(__name__)
 app.title = 'System Monitoring Dashboard'
 
-# Define the layout with dcc.Store components for storing data
+def _no_memoize(timeout=None):
+    return lambda func: func
+
+memoize = _no_memoize
+
+# A cache shared on disk lets several server workers reuse a single psutil sample.
+# Entries are unpickled on read, so the directory must be private to this user.
+if Cache is not None:
+    CACHE_DIR = os.path.join(app.server.instance_path, 'dashcache')
+    try:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        if os.stat(CACHE_DIR).st_uid != os.getuid():
+            raise PermissionError(f"{CACHE_DIR} is owned by another user")
+        os.chmod(CACHE_DIR, 0o700)
+    except OSError as e:
+        logger.warning(f"Metrics cache disabled: {e}")
+    else:
+        cache = Cache(app.server, config={
+            'CACHE_TYPE': 'FileSystemCache',
+            'CACHE_DIR': CACHE_DIR,
+            'CACHE_DEFAULT_TIMEOUT': 1,
+        })
+        memoize = cache.memoize
+
+def usage_figure(title):
+    """
+    Builds a 0-100% line chart for a single usage metric.
+    """
+    return {
+        'data': [go.Scatter(
+            x=[],
+            y=[],
+            mode='lines+markers',
+            name=title
+        )],
+        'layout': go.Layout(
+            title=title,
+            xaxis=dict(type='date', tickformat='%H:%M:%S', title='Time'),
+            yaxis=dict(range=[0, 100], title=title),
+        )
+    }
+
+def network_figure():
+    """
+    Builds the network I/O chart with one trace per direction.
+    """
+    return {
+        'data': [
+            go.Scatter(
+                x=[],
+                y=[],
+                mode='lines+markers',
+                name='Bytes Sent'
+            ),
+            go.Scatter(
+                x=[],
+                y=[],
+                mode='lines+markers',
+                name='Bytes Received'
+            )
+        ],
+        'layout': go.Layout(
+            title='Network I/O (Bytes/sec)',
+            xaxis=dict(type='date', tickformat='%H:%M:%S', title='Time'),
+            yaxis=dict(title='Bytes per Second'),
+        )
+    }
+
+# Figures are built once; callbacks only patch their data arrays
+FIGURES = {
+    'cpu': usage_figure('CPU Usage (%)'),
+    'memory': usage_figure('Memory Usage (%)'),
+    'disk': usage_figure('Disk Usage (%)'),
+    'network': network_figure(),
+}
+
+# Define the layout
 app.layout = html.Div(children=[
     html.H1('System Monitoring Dashboard', style={'textAlign': 'center'}),
 
@@ -18,264 +109,150 @@ app.layout = html.Div(children=[
     html.Div(id='live-update-text', style={'textAlign': 'center'}),
 
     # Graphs for system metrics
-    dcc.Graph(id='cpu-usage-graph'),
-    dcc.Graph(id='memory-usage-graph'),
-    dcc.Graph(id='disk-usage-graph'),
-    dcc.Graph(id='network-io-graph'),
-
-    # Hidden divs to store intermediate data
-    dcc.Store(id='cpu-data-store', storage_type='memory'),
-    dcc.Store(id='memory-data-store', storage_type='memory'),
-    dcc.Store(id='disk-data-store', storage_type='memory'),
-    dcc.Store(id='network-data-store', storage_type='memory'),
+    dcc.Graph(id='cpu-usage-graph', figure=FIGURES['cpu']),
+    dcc.Graph(id='memory-usage-graph', figure=FIGURES['memory']),
+    dcc.Graph(id='disk-usage-graph', figure=FIGURES['disk']),
+    dcc.Graph(id='network-io-graph', figure=FIGURES['network']),
 
     # Interval component for updates
     dcc.Interval(
         id='interval-component',
-        interval=2*1000,  # Update every 2 seconds
+        interval=UPDATE_INTERVAL*1000,  # Update every 2 seconds
         n_intervals=0
     )
 ])
 
-# Callback to update live metrics text
-@app.callback(
-    Output('live-update-text', 'children'),
-    Input('interval-component', 'n_intervals')
-)
-def update_metrics(n):
-    metrics = get_system_metrics()
-    style = {'padding': '5px', 'fontSize': '20px'}
+_disk_cache = {'ts': float('-inf'), 'val': None}
 
-    return [
-        html.Span(f"CPU Usage: {metrics['cpu_percent']}%", style=style),
-        html.Br(),
-        html.Span(f"Memory Usage: {metrics['memory_percent']}%", style=style),
-        html.Br(),
-        html.Span(f"Disk Usage: {metrics['disk_percent']}%", style=style),
-    ]
+def disk_percent():
+    """
+    Returns the root filesystem usage, refreshed at most every DISK_CACHE_TTL seconds.
+    statvfs can block on networked filesystems, so it is kept off the per-tick path.
+    """
+    now = time.monotonic()
+    if now - _disk_cache['ts'] > DISK_CACHE_TTL:
+        _disk_cache.update(ts=now, val=psutil.disk_usage('/').percent)
+    return _disk_cache['val']
 
+@memoize(timeout=1)
 def get_system_metrics():
     """
     Collects and returns system metrics like CPU, memory, disk, and network usage.
     """
+    net = psutil.net_io_counters()
     metrics = {
         'cpu_percent': psutil.cpu_percent(interval=None),
         'memory_percent': psutil.virtual_memory().percent,
-        'disk_percent': psutil.disk_usage('/').percent,
-        'network_sent': psutil.net_io_counters().bytes_sent,
-        'network_recv': psutil.net_io_counters().bytes_recv,
+        'disk_percent': disk_percent(),
+        'network_sent': net.bytes_sent,
+        'network_recv': net.bytes_recv,
     }
     return metrics
 
-# Callback to update CPU data store
-@app.callback(
-    Output('cpu-data-store', 'data'),
-    Input('interval-component', 'n_intervals'),
-    State('cpu-data-store', 'data')
-)
-def update_cpu_data(n, data):
-    time_now = datetime.datetime.now().strftime('%H:%M:%S')
-    cpu_percent = psutil.cpu_percent()
-
-    if data is None:
-        data = {'times': [], 'values': []}
-
-    data['times'].append(time_now)
-    data['values'].append(cpu_percent)
-
-    # Keep only the last 50 entries
-    data['times'] = data['times'][-50:]
-    data['values'] = data['values'][-50:]
-
-    return data
-
-# Callback to update CPU graph
-@app.callback(
-    Output('cpu-usage-graph', 'figure'),
-    Input('cpu-data-store', 'data')
-)
-def update_cpu_graph(data):
-    if data is None:
-        data = {'times': [], 'values': []}
-
-    figure = {
-        'data': [go.Scatter(
-            x=data['times'],
-            y=data['values'],
-            mode='lines+markers',
-            name='CPU Usage (%)'
-        )],
-        'layout': go.Layout(
-            title='CPU Usage (%)',
-            xaxis=dict(title='Time'),
-            yaxis=dict(range=[0, 100], title='CPU Usage (%)'),
-        )
-    }
-    return figure
-
-# Callback to update Memory data store
-@app.callback(
-    Output('memory-data-store', 'data'),
-    Input('interval-component', 'n_intervals'),
-    State('memory-data-store', 'data')
-)
-def update_memory_data(n, data):
-    time_now = datetime.datetime.now().strftime('%H:%M:%S')
-    memory_percent = psutil.virtual_memory().percent
-
-    if data is None:
-        data = {'times': [], 'values': []}
-
-    data['times'].append(time_now)
-    data['values'].append(memory_percent)
-
-    # Keep only the last 50 entries
-    data['times'] = data['times'][-50:]
-    data['values'] = data['values'][-50:]
-
-    return data
-
-# Callback to update Memory graph
-@app.callback(
-    Output('memory-usage-graph', 'figure'),
-    Input('memory-data-store', 'data')
-)
-def update_memory_graph(data):
-    if data is None:
-        data = {'times': [], 'values': []}
-
-    figure = {
-        'data': [go.Scatter(
-            x=data['times'],
-            y=data['values'],
-            mode='lines+markers',
-            name='Memory Usage (%)'
-        )],
-        'layout': go.Layout(
-            title='Memory Usage (%)',
-            xaxis=dict(title='Time'),
-            yaxis=dict(range=[0, 100], title='Memory Usage (%)'),
-        )
-    }
-    return figure
-
-# Callback to update Disk data store
-@app.callback(
-    Output('disk-data-store', 'data'),
-    Input('interval-component', 'n_intervals'),
-    State('disk-data-store', 'data')
-)
-def update_disk_data(n, data):
-    time_now = datetime.datetime.now().strftime('%H:%M:%S')
-    disk_percent = psutil.disk_usage('/').percent
-
-    if data is None:
-        data = {'times': [], 'values': []}
-
-    data['times'].append(time_now)
-    data['values'].append(disk_percent)
-
-    # Keep only the last 50 entries
-    data['times'] = data['times'][-50:]
-    data['values'] = data['values'][-50:]
-
-    return data
+def plot_time(timestamp):
+    """
+    Converts a UNIX timestamp to epoch milliseconds for a Plotly date axis.
+    Plotly renders numeric dates as UTC, so the local UTC offset is added first.
+    """
+    return (timestamp + time.localtime(timestamp).tm_gmtoff) * 1000
 
-# Callback to update Disk graph
-@app.callback(
-    Output('disk-usage-graph', 'figure'),
-    Input('disk-data-store', 'data')
-)
-def update_disk_graph(data):
-    if data is None:
-        data = {'times': [], 'values': []}
+class Snapshot(NamedTuple):
+    time: float
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    network_sent: int
+    network_recv: int
 
-    figure = {
-        'data': [go.Scatter(
-            x=data['times'],
-            y=data['values'],
-            mode='lines+markers',
-            name='Disk Usage (%)'
-        )],
-        'layout': go.Layout(
-            title='Disk Usage (%)',
-            xaxis=dict(title='Time'),
-            yaxis=dict(range=[0, 100], title='Disk Usage (%)'),
+class MetricsSampler(threading.Thread):
+    """
+    Background thread sampling system metrics once per interval.
+    Dash callbacks read the ring buffer instead of calling psutil themselves.
+    """
+    def __init__(self, interval=UPDATE_INTERVAL, maxlen=HISTORY_LENGTH):
+        super().__init__(name='metrics-sampler', daemon=True)
+        self.interval = interval
+        # Whole samples are appended at once, so readers never see a partial one
+        self.history = deque(maxlen=maxlen)
+        self._previous = None
+
+    def _snapshot(self):
+        return Snapshot(
+            time=time.time(),
+            **get_system_metrics()
         )
-    }
-    return figure
 
-# Callback to update Network I/O data store
-@app.callback(
-    Output('network-data-store', 'data'),
-    Input('interval-component', 'n_intervals'),
-    State('network-data-store', 'data')
-)
-def update_network_data(n, data):
-    time_now = datetime.datetime.now().strftime('%H:%M:%S')
-    net_io = psutil.net_io_counters()
-    bytes_sent = net_io.bytes_sent
-    bytes_recv = net_io.bytes_recv
-
-    if data is None:
-        data = {
-            'times': [],
-            'bytes_sent': [],
-            'bytes_recv': [],
-            'last_bytes_sent': bytes_sent,
-            'last_bytes_recv': bytes_recv
-        }
-
-    # Calculate bytes per interval
-    sent_per_sec = bytes_sent - data.get('last_bytes_sent', bytes_sent)
-    recv_per_sec = bytes_recv - data.get('last_bytes_recv', bytes_recv)
-
-    data['times'].append(time_now)
-    data['bytes_sent'].append(sent_per_sec)
-    data['bytes_recv'].append(recv_per_sec)
-
-    # Update last bytes sent and received
-    data['last_bytes_sent'] = bytes_sent
-    data['last_bytes_recv'] = bytes_recv
-
-    # Keep only the last 50 entries
-    data['times'] = data['times'][-50:]
-    data['bytes_sent'] = data['bytes_sent'][-50:]
-    data['bytes_recv'] = data['bytes_recv'][-50:]
-
-    return data
+    def run(self):
+        # Prime psutil's CPU counters so the first sample is meaningful
+        psutil.cpu_percent(interval=None)
+        while True:
+            # Wake on wall-clock interval boundaries, so the samplers of every
+            # server worker ask for metrics within the same cache entry's lifetime
+            time.sleep(self.interval - time.time() % self.interval)
+            try:
+                snap = self._snapshot()
+                previous = self._previous or snap
+
+                # History entries hold plot times and the bytes moved since the previous sample
+                self.history.append(snap._replace(
+                    time=plot_time(snap.time),
+                    network_sent=snap.network_sent - previous.network_sent,
+                    network_recv=snap.network_recv - previous.network_recv,
+                ))
+                self._previous = snap
+            except Exception as e:
+                # Skip this sample and keep sampling; the next one is measured against the last good one
+                logger.exception("Failed to sample system metrics")
+
+sampler = MetricsSampler()
+sampler.start()
+
+def patch_traces(times, *series):
+    """
+    Returns a Patch replacing only the x/y arrays of each trace, in order.
+    """
+    patch = Patch()
+    for index, values in enumerate(series):
+        patch['data'][index]['x'] = times
+        patch['data'][index]['y'] = values
+    return patch
 
-# Callback to update Network I/O graph
+# Single callback refreshing the live text and every graph once per interval
 @app.callback(
-    Output('network-io-graph', 'figure'),
-    Input('network-data-store', 'data')
+    [
+        Output('live-update-text', 'children'),
+        Output('cpu-usage-graph', 'figure'),
+        Output('memory-usage-graph', 'figure'),
+        Output('disk-usage-graph', 'figure'),
+        Output('network-io-graph', 'figure'),
+    ],
+    Input('interval-component', 'n_intervals')
 )
-def update_network_graph(data):
-    if data is None:
-        data = {'times': [], 'bytes_sent': [], 'bytes_recv': []}
+def update_dashboard(n):
+    # Copy the history once; every column below comes from the same samples
+    history = list(sampler.history)
+    style = {'padding': '5px', 'fontSize': '20px'}
 
-    figure = {
-        'data': [
-            go.Scatter(
-                x=data['times'],
-                y=data['bytes_sent'],
-                mode='lines+markers',
-                name='Bytes Sent'
-            ),
-            go.Scatter(
-                x=data['times'],
-                y=data['bytes_recv'],
-                mode='lines+markers',
-                name='Bytes Received'
-            )
-        ],
-        'layout': go.Layout(
-            title='Network I/O (Bytes/sec)',
-            xaxis=dict(title='Time'),
-            yaxis=dict(title='Bytes per Second'),
-        )
-    }
-    return figure
+    live_text = []
+    if history:
+        metrics = history[-1]
+        live_text = [
+            html.Span(f"CPU Usage: {metrics.cpu_percent}%", style=style),
+            html.Br(),
+            html.Span(f"Memory Usage: {metrics.memory_percent}%", style=style),
+            html.Br(),
+            html.Span(f"Disk Usage: {metrics.disk_percent}%", style=style),
+        ]
+
+    times = [sample.time for sample in history]
+    return (
+        live_text,
+        patch_traces(times, [sample.cpu_percent for sample in history]),
+        patch_traces(times, [sample.memory_percent for sample in history]),
+        patch_traces(times, [sample.disk_percent for sample in history]),
+        patch_traces(times, [sample.network_sent for sample in history],
+                     [sample.network_recv for sample in history]),
+    )
 
 if __name__ == '__main__':
     app.run_server(debug=True)
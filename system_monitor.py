@@ -7,6 +7,7 @@ from loguru import logger
 from rich.console import Console, Theme
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich.layout import Layout
 from rich import box
 from rich.live import Live
@@ -16,7 +17,14 @@ import threading
 import yaml
 import os
 import platform
-import keyboard  # For non-blocking key detection
+import select
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+try:
+    from pystemd.dbuslib import DBus
+    from pystemd.systemd1 import Manager, Unit
+except ImportError:
+    Manager = None  # Fall back to spawning systemctl
 
 # Attempt to import log_parser, handle if not found
 try:
@@ -32,9 +40,15 @@ if not os.path.exists(CONFIG_FILE):
     logger.error(f"Configuration file '{CONFIG_FILE}' not found.")
     sys.exit(1)
 
+# Prefer the LibYAML-backed loader, fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 with open(CONFIG_FILE, 'r') as f:
     try:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_Loader)
     except yaml.YAMLError as e:
         logger.error(f"Error parsing configuration file: {e}")
         sys.exit(1)
@@ -43,6 +57,9 @@ with open(CONFIG_FILE, 'r') as f:
 MONITORED_SERVICES = config.get('services', ['ssh.service', 'cron.service', 'networking.service'])
 LOG_LIMIT = config.get('log_limit', 10)
 REFRESH_RATE = config.get('refresh_rate', 2)  # in seconds
+SERVICE_STATUS_TTL = config.get('service_status_ttl', 15)  # in seconds
+DISK_CACHE_TTL = 30  # in seconds, disk usage changes slowly
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 # Configure Loguru to log errors and above to a file with rotation
 logger.remove()  # Remove default handlers
@@ -56,9 +73,84 @@ dark_theme = Theme(themes_config.get('dark', {}))
 # Initialize console with dark theme by default
 console = Console(theme=dark_theme)
 
-# Lock for thread-safe theme switching
+# Totals never change at runtime, format them once
+_GIB = 1 << 30
+_MIB = 1 << 20
+_MEM_TOTAL_GB = round(psutil.virtual_memory().total / _GIB, 2)
+_DISK_TOTAL_GB = round(psutil.disk_usage('/').total / _GIB, 2)
+_MEM_TOTAL_STR = f"{_MEM_TOTAL_GB} GB"
+_DISK_TOTAL_STR = f"{_DISK_TOTAL_GB} GB"
+
+# Shared worker pool for the independent stages of each report
+_REPORT_POOL = ThreadPoolExecutor(max_workers=6)
+REPORT_TIMEOUT = 15  # in seconds, for all stages of a report together
+
+# Lock for thread-safe theme switching; only guards the toggle itself
 theme_lock = threading.Lock()
 current_theme = "dark"
+theme_dirty = threading.Event()
+
+# Set on shutdown so background threads can exit
+stop_event = threading.Event()
+
+_disk_cache = {'ts': float('-inf'), 'val': None}
+
+# Prime psutil's CPU counters so non-blocking reads return the usage since the last call
+psutil.cpu_percent(interval=None)
+_cpu_cache = {'ts': time.monotonic(), 'val': 0.0}
+
+def get_cpu_usage():
+    """
+    Returns CPU usage since the previous call without blocking.
+    Calls less than 0.1s apart reuse the last value, as psutil would report 0.0.
+    """
+    now = time.monotonic()
+    if now - _cpu_cache['ts'] >= 0.1:
+        _cpu_cache.update(ts=now, val=psutil.cpu_percent(interval=None))
+    return _cpu_cache['val']
+
+def _statvfs_usage(path):
+    """
+    Returns filesystem usage for `path` from a single statvfs call.
+    Mirrors psutil.disk_usage, which reports percent against space available to users.
+    """
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    usable = used + free
+    return {
+        "total": total,
+        "used": used,
+        "free": free,
+        "percent": round(used / usable * 100, 1) if usable else 0.0,
+    }
+
+def get_disk_usage():
+    """
+    Returns root filesystem usage, refreshed at most every DISK_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    if now - _disk_cache['ts'] > DISK_CACHE_TTL:
+        _disk_cache.update(ts=now, val=_statvfs_usage('/'))
+    return _disk_cache['val']
+
+_net_io = psutil.net_io_counters()
+_net_prev = {'ts': time.monotonic(), 'bytes_sent': _net_io.bytes_sent, 'bytes_recv': _net_io.bytes_recv}
+
+def get_network_rates():
+    """
+    Returns network throughput in MB/s since the previous call.
+    """
+    net = psutil.net_io_counters()
+    now = time.monotonic()
+    elapsed = now - _net_prev['ts']
+    rates = {"sent": 0.0, "recv": 0.0}
+    if elapsed > 0:
+        rates["sent"] = (net.bytes_sent - _net_prev['bytes_sent']) / elapsed / _MIB
+        rates["recv"] = (net.bytes_recv - _net_prev['bytes_recv']) / elapsed / _MIB
+    _net_prev.update(ts=now, bytes_sent=net.bytes_sent, bytes_recv=net.bytes_recv)
+    return rates
 
 def get_system_metrics():
     """
@@ -66,10 +158,10 @@ def get_system_metrics():
     """
     try:
         metrics = {
-            "cpu_usage": psutil.cpu_percent(interval=1),
+            "cpu_usage": get_cpu_usage(),
             "memory": psutil.virtual_memory()._asdict(),
-            "disk": psutil.disk_usage('/')._asdict(),
-            "network": psutil.net_io_counters()._asdict()
+            "disk": get_disk_usage(),
+            "network": get_network_rates()
         }
         return metrics
     except Exception as e:
@@ -82,144 +174,337 @@ def get_pmu_services():
     """
     return MONITORED_SERVICES
 
-def get_service_status(service_name):
+def _service_record(service_name, value):
     """
-    Retrieves the status of a given service.
+    Builds a service status entry with every field set to the same placeholder.
+    """
+    return {
+        "name": service_name,
+        "status": value,
+        "enabled": value,
+        "active_state": value,
+        "sub_state": value,
+    }
+
+def _parse_systemctl_show(output):
+    """
+    Parses `systemctl show` output into one property dict per unit.
+    """
+    records = []
+    output = output.strip()
+    if not output:
+        return records
+    for block in output.split('\n\n'):
+        props = {}
+        for line in block.splitlines():
+            key, _, value = line.partition('=')
+            props[key] = value
+        records.append(props)
+    return records
+
+_dbus = {"bus": None, "manager": None, "units": {}, "failed": False}
+# An sd-bus connection must not be used from two threads at once
+_dbus_lock = threading.Lock()
+
+def _get_manager():
+    """
+    Returns a systemd Manager on a persistent D-Bus connection, or None if unavailable.
+    """
+    if Manager is None or platform.system() != "Linux":
+        return None
+    with _dbus_lock:
+        if _dbus["manager"] is None and not _dbus["failed"]:
+            try:
+                bus = DBus()
+                bus.open()
+                manager = Manager(bus=bus)
+                manager.load()
+                _dbus.update(bus=bus, manager=manager)
+            except Exception as e:
+                logger.exception("Failed to connect to systemd over D-Bus, falling back to systemctl.")
+                _dbus["failed"] = True
+        return _dbus["manager"]
+
+def _dbus_unit_properties(manager, service_name, properties):
+    """
+    Reads unit properties over D-Bus, loading the unit object once per service.
+    """
+    unit = _dbus["units"].get(service_name)
+    if unit is None:
+        unit = Unit(manager.Manager.LoadUnit(service_name.encode()), bus=_dbus["bus"], _autoload=True)
+        _dbus["units"][service_name] = unit
+    return {prop: getattr(unit.Unit, prop).decode() for prop in properties}
+
+def _query_units(services, properties):
+    """
+    Returns one {property: value} dict per service, in order.
+    Uses the systemd D-Bus API when available and falls back to `systemctl show`.
+    """
+    manager = _get_manager()
+    if manager is not None:
+        try:
+            with _dbus_lock:
+                return [_dbus_unit_properties(manager, service, properties) for service in services]
+        except Exception as e:
+            logger.exception("Failed to query services over D-Bus, falling back to systemctl.")
+
+    result = subprocess.run(
+        ['systemctl', 'show', f"--property={','.join(properties)}", '--no-pager', '--', *services],
+        capture_output=True, text=True, timeout=5
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"systemctl show exited with status {result.returncode}: {result.stderr.strip()}")
+    # systemctl prints one blank-line separated block per unit, in argument order
+    records = _parse_systemctl_show(result.stdout)
+    if len(records) != len(services):
+        raise RuntimeError(f"systemctl show returned {len(records)} records for {len(services)} services: {result.stderr.strip()}")
+    return records
+
+# Service states change slowly, reuse query results for SERVICE_STATUS_TTL seconds
+_service_cache = {}
+_service_cache_lock = threading.Lock()
+
+def get_services_status(services):
+    """
+    Retrieves the status of the given services, querying only those not cached.
     """
     if platform.system() != "Linux":
         logger.warning("Service monitoring is only supported on Linux systems.")
-        return {
-            "name": service_name,
-            "status": "Unsupported",
-            "enabled": "Unsupported",
-            "active_state": "Unsupported",
-            "sub_state": "Unsupported",
+        return [_service_record(service, "Unsupported") for service in services]
+
+    now = time.monotonic()
+    with _service_cache_lock:
+        statuses = {
+            service: status
+            for service, (checked, status) in _service_cache.items()
+            if service in services and now - checked < SERVICE_STATUS_TTL
         }
+    missing = [service for service in services if service not in statuses]
+    if not missing:
+        return [statuses[service] for service in services]
 
     try:
-        result = subprocess.run(['systemctl', 'is-active', service_name], capture_output=True, text=True, timeout=5)
-        status = result.stdout.strip()
-        active = status == "active"
-        
-        result_enabled = subprocess.run(['systemctl', 'is-enabled', service_name], capture_output=True, text=True, timeout=5)
-        enabled = result_enabled.stdout.strip()
-        
-        return {
-            "name": service_name,
-            "status": "Running" if active else "Not Running",
-            "enabled": enabled.capitalize(),
-            "active_state": status.capitalize(),
-            "sub_state": "N/A",  # systemctl is-active doesn't provide sub-state directly
-        }
+        records = _query_units(missing, ["ActiveState", "SubState", "UnitFileState", "LoadState"])
+        with _service_cache_lock:
+            for service_name, props in zip(missing, records):
+                active_state = props.get("ActiveState", "")
+                status = {
+                    "name": service_name,
+                    "status": "Running" if active_state == "active" else "Not Running",
+                    "enabled": (props.get("UnitFileState") or props.get("LoadState", "")).capitalize(),
+                    "active_state": active_state.capitalize(),
+                    "sub_state": props.get("SubState", "").capitalize(),
+                }
+                statuses[service_name] = status
+                _service_cache[service_name] = (now, status)
     except subprocess.TimeoutExpired:
-        logger.error(f"Timeout while checking status for service: {service_name}")
+        logger.error(f"Timeout while checking status for services: {', '.join(missing)}")
     except Exception as e:
-        logger.exception(f"Error retrieving status for service: {service_name}")
+        logger.exception(f"Error retrieving status for services: {', '.join(missing)}")
 
-    return {
-        "name": service_name,
-        "status": "Unknown",
-        "enabled": "Unknown",
-        "active_state": "Unknown",
-        "sub_state": "Unknown",
-    }
+    # Failed lookups are reported as unknown and retried on the next refresh
+    return [statuses.get(service) or _service_record(service, "Unknown") for service in services]
+
+def get_service_status(service_name):
+    """
+    Retrieves the status of a given service.
+    """
+    return get_services_status([service_name])[0]
+
+def _stage_result(future, deadline, name, default):
+    """
+    Waits for a report stage until `deadline`, substituting `default` if it failed or is too slow.
+    """
+    try:
+        return future.result(timeout=max(0, deadline - time.monotonic()))
+    except FutureTimeoutError:
+        # Drop the stage if it is still queued behind a hung one
+        future.cancel()
+        logger.error(f"Timeout while collecting {name}.")
+    except Exception as e:
+        logger.exception(f"Failed to collect {name}.")
+    return default
 
 def generate_system_report(log_limit=10):
     """
     Generates a report with system metrics, service statuses, and error logs.
     """
     pmu_services = get_pmu_services()
+
+    # The stages are independent and mostly wait on I/O, run them side by side
+    metrics_future = _REPORT_POOL.submit(get_system_metrics)
+    services_future = _REPORT_POOL.submit(get_services_status, pmu_services)
+    kernel_future = _REPORT_POOL.submit(log_parser.get_kernel_logs, limit=log_limit)
+    middleware_future = _REPORT_POOL.submit(log_parser.get_middleware_logs, limit=log_limit)
+    system_future = _REPORT_POOL.submit(log_parser.get_system_logs, limit=log_limit)
+    # One deadline for the whole report, so several slow stages do not add up
+    deadline = time.monotonic() + REPORT_TIMEOUT
+
     report = {
         "timestamp": datetime.now(),
-        "system_metrics": get_system_metrics(),
-        "services_status": [get_service_status(service) for service in pmu_services],
-        "kernel_logs": log_parser.get_kernel_logs(limit=log_limit),
-        "middleware_logs": log_parser.get_middleware_logs(limit=log_limit),
-        "system_logs": log_parser.get_system_logs(limit=log_limit)
+        "system_metrics": _stage_result(metrics_future, deadline, "system metrics", {}),
+        "services_status": _stage_result(services_future, deadline, "service statuses",
+                                         [_service_record(service, "Unknown") for service in pmu_services]),
+        "kernel_logs": _stage_result(kernel_future, deadline, "kernel logs", []),
+        "middleware_logs": _stage_result(middleware_future, deadline, "middleware logs", {}),
+        "system_logs": _stage_result(system_future, deadline, "system logs", [])
     }
     return report
 
-def create_dashboard(report):
+# Prebuilt cells, so Rich does not parse markup for them on every refresh.
+# Style names are resolved against the console theme at render time.
+_PROBLEM_CELLS = {
+    True: Text("No", style="bold green"),
+    False: Text("Yes", style="error"),
+}
+
+def _usage_cell(value, usage_str):
     """
-    Creates and returns the dashboard layout with updated data.
+    Returns a metric cell, highlighted with the theme's error style above 80%.
     """
-    with theme_lock:
+    return Text(usage_str, style="error" if value > 80 else "")
+
+def _reset_table(table):
+    """
+    Removes all rows from a Rich table while keeping its columns.
+    """
+    table.rows.clear()
+    for column in table.columns:
+        column._cells.clear()
+
+class Dashboard:
+    """
+    Console dashboard whose layout and tables are built once and refreshed in place.
+    """
+    def __init__(self):
+        self.theme_name = "dark"
+
         # Create a layout with three rows
-        layout = Layout()
+        self.layout = Layout()
 
         # Split the layout into header, body, and footer
-        layout.split(
+        self.layout.split(
             Layout(name="header", size=3),
             Layout(name="body", ratio=1),
             Layout(name="footer", size=1),
         )
 
-        # Header with timestamp
-        header_text = f"System Monitor - Last Updated: {report['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}"
-        layout["header"].update(Panel(header_text, style="header"))
-
         # Body - split into upper and lower sections
-        layout["body"].split_column(
+        self.layout["body"].split_column(
             Layout(name="upper", ratio=2),
             Layout(name="lower", ratio=1),
         )
 
         # Upper layout split into two columns
-        layout["body"]["upper"].split_row(
+        self.layout["body"]["upper"].split_row(
             Layout(name="metrics"),
             Layout(name="services"),
         )
 
         # Lower layout split into three columns for logs
-        layout["body"]["lower"].split_row(
+        self.layout["body"]["lower"].split_row(
             Layout(name="kernel_logs"),
             Layout(name="middleware_logs"),
             Layout(name="system_logs"),
         )
 
         # System Metrics
-        metrics_table = Table(title="System Metrics", style="info", box=box.SQUARE)
-        metrics_table.add_column("Metric", style="bold green")
-        metrics_table.add_column("Value", style="bold cyan")
-
-        cpu_usage = report['system_metrics']['cpu_usage']
-        cpu_usage_str = f"{cpu_usage}%"
-        if cpu_usage > 80:
-            cpu_usage_str = f"[error]{cpu_usage}%[/error]"
-        metrics_table.add_row("CPU Usage", cpu_usage_str)
-
-        mem = report['system_metrics']['memory']
-        mem_used_gb = round((mem['total'] - mem['available']) / (1024 ** 3), 2)
-        mem_total_gb = round(mem['total'] / (1024 ** 3), 2)
-        mem_percent = mem['percent']
-        mem_usage_str = f"{mem_used_gb} GB / {mem_total_gb} GB ({mem_percent}%)"
-        if mem_percent > 80:
-            mem_usage_str = f"[error]{mem_usage_str}[/error]"
-        metrics_table.add_row("Memory Used", mem_usage_str)
-
-        disk = report['system_metrics']['disk']
-        disk_used_gb = round(disk['used'] / (1024 ** 3), 2)
-        disk_total_gb = round(disk['total'] / (1024 ** 3), 2)
-        disk_percent = disk['percent']
-        disk_usage_str = f"{disk_used_gb} GB / {disk_total_gb} GB ({disk_percent}%)"
-        if disk_percent > 80:
-            disk_usage_str = f"[error]{disk_usage_str}[/error]"
-        metrics_table.add_row("Disk Used", disk_usage_str)
-
-        net = report['system_metrics']['network']
-        net_sent_mb = round(net['bytes_sent'] / (1024 ** 2), 2)
-        net_recv_mb = round(net['bytes_recv'] / (1024 ** 2), 2)
-        metrics_table.add_row("Network Sent", f"{net_sent_mb} MB")
-        metrics_table.add_row("Network Received", f"{net_recv_mb} MB")
+        self.metrics_table = Table(title="System Metrics", style="info", box=box.SQUARE)
+        self.metrics_table.add_column("Metric", style="bold green")
+        self.metrics_table.add_column("Value", style="bold cyan")
+
+        # Services Status
+        self.services_table = Table(title="Services Status", style="info", box=box.SQUARE)
+        self.services_table.add_column("Service", style="bold green")
+        self.services_table.add_column("Status", style="bold cyan")
+        self.services_table.add_column("Enabled", style="bold cyan")
+        self.services_table.add_column("Active State", style="bold cyan")
+        self.services_table.add_column("Sub State", style="bold cyan")
+        self.services_table.add_column("Problem", style="bold red")
+
+        # Kernel Logs
+        self.kernel_table = Table(title="Kernel Error Logs", style="info", box=box.SQUARE, show_lines=True)
+        self.kernel_table.add_column("Timestamp", style="dim", width=20)
+        self.kernel_table.add_column("Message", style="bold", overflow="fold", max_width=60)
+        self.kernel_empty = Panel("[bold yellow]No kernel error logs found.[/bold yellow]", title="Kernel Error Logs")
+
+        # Middleware Logs
+        self.middleware_table = Table(title="Middleware Error Logs", style="info", box=box.SQUARE, show_lines=True)
+        self.middleware_table.add_column("Log File", style="dim")
+        self.middleware_table.add_column("Message", style="bold", overflow="fold", max_width=60)
+        self.middleware_empty = Panel("[bold yellow]No middleware error logs found.[/bold yellow]", title="Middleware Error Logs")
+
+        # System Logs
+        self.system_table = Table(title="System Error Logs", style="info", box=box.SQUARE, show_lines=True)
+        self.system_table.add_column("Timestamp", style="dim", width=20)
+        self.system_table.add_column("Message", style="bold", overflow="fold", max_width=60)
+        self.system_empty = Panel("[bold yellow]No system error logs found.[/bold yellow]", title="System Error Logs")
+
+        self.layout["body"]["upper"]["metrics"].update(self.metrics_table)
+        self.layout["body"]["upper"]["services"].update(self.services_table)
+
+        # Footer with instructions
+        footer_text = "Press 'd' to toggle dark/light mode | Press 'Ctrl+C' to exit"
+        self.layout["footer"].update(Panel(footer_text, style="footer"))
+
+    def apply_theme(self, theme_name):
+        """
+        Switches the console theme; the dark theme is the base of the console's theme stack.
+        """
+        if theme_name == self.theme_name:
+            return
+        if theme_name == "light":
+            console.push_theme(light_theme)
+        else:
+            console.pop_theme()
+        self.theme_name = theme_name
+
+    def render(self):
+        """
+        Returns the layout for the next frame, applying a pending theme toggle first.
+        """
+        if theme_dirty.is_set():
+            theme_dirty.clear()
+            self.apply_theme(current_theme)
+        return self.layout
+
+    def update(self, report):
+        """
+        Refreshes the dashboard tables in place with the data of a new report.
+        """
+        # Header with timestamp
+        header_text = f"System Monitor - Last Updated: {report['timestamp'].strftime(TIMESTAMP_FORMAT)}"
+        self.layout["header"].update(Panel(header_text, style="header"))
+
+        # System Metrics
+        _reset_table(self.metrics_table)
+
+        system_metrics = report.get("system_metrics", {})
+        if system_metrics:
+            cpu_usage = system_metrics['cpu_usage']
+            self.metrics_table.add_row("CPU Usage", _usage_cell(cpu_usage, f"{cpu_usage}%"))
+
+            mem = system_metrics['memory']
+            mem_used_gb = round((mem['total'] - mem['available']) / _GIB, 2)
+            mem_percent = mem['percent']
+            mem_usage_str = f"{mem_used_gb} GB / {_MEM_TOTAL_STR} ({mem_percent}%)"
+            self.metrics_table.add_row("Memory Used", _usage_cell(mem_percent, mem_usage_str))
+
+            disk = system_metrics['disk']
+            disk_used_gb = round(disk['used'] / _GIB, 2)
+            disk_percent = disk['percent']
+            disk_usage_str = f"{disk_used_gb} GB / {_DISK_TOTAL_STR} ({disk_percent}%)"
+            self.metrics_table.add_row("Disk Used", _usage_cell(disk_percent, disk_usage_str))
+
+            net = system_metrics['network']
+            self.metrics_table.add_row("Network Sent", f"{round(net['sent'], 2)} MB/s")
+            self.metrics_table.add_row("Network Received", f"{round(net['recv'], 2)} MB/s")
+        else:
+            # The metrics stage failed or timed out; keep refreshing the other panels
+            self.metrics_table.add_row("No metrics available.", "N/A")
 
         # Services Status
-        services_table = Table(title="Services Status", style="info", box=box.SQUARE)
-        services_table.add_column("Service", style="bold green")
-        services_table.add_column("Status", style="bold cyan")
-        services_table.add_column("Enabled", style="bold cyan")
-        services_table.add_column("Active State", style="bold cyan")
-        services_table.add_column("Sub State", style="bold cyan")
-        services_table.add_column("Problem", style="bold red")
+        _reset_table(self.services_table)
 
         services_status = report.get("services_status", [])
         if services_status:
@@ -229,8 +514,8 @@ def create_dashboard(report):
                 enabled = service.get("enabled", "Unknown")
                 active_state = service.get("active_state", "Unknown")
                 sub_state = service.get("sub_state", "Unknown")
-                problem = "[bold green]No[/bold green]" if status == "Running" else "[error]Yes[/error]"
-                services_table.add_row(
+                problem = _PROBLEM_CELLS[status == "Running"]
+                self.services_table.add_row(
                     service_name,
                     status,
                     enabled,
@@ -239,80 +524,105 @@ def create_dashboard(report):
                     problem
                 )
         else:
-            services_table.add_row("No services found.", "", "", "", "", "")
-
-        layout["body"]["upper"]["metrics"].update(metrics_table)
-        layout["body"]["upper"]["services"].update(services_table)
+            self.services_table.add_row("No services found.", "", "", "", "", "")
 
         # Kernel Logs
+        _reset_table(self.kernel_table)
+
         kernel_logs = report.get("kernel_logs", [])
         if kernel_logs:
-            kernel_logs_table = Table(title="Kernel Error Logs", style="info", box=box.SQUARE, show_lines=True)
-            kernel_logs_table.add_column("Timestamp", style="dim", width=20)
-            kernel_logs_table.add_column("Message", style="bold", overflow="fold", max_width=60)
             for log in kernel_logs:
-                timestamp = log.get('timestamp', datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = log.get('timestamp')
+                timestamp = timestamp.strftime(TIMESTAMP_FORMAT) if timestamp is not None else ""
                 message = log.get('message', 'No message')
-                kernel_logs_table.add_row(timestamp, message)
-            layout["body"]["lower"]["kernel_logs"].update(kernel_logs_table)
+                self.kernel_table.add_row(timestamp, message)
+            self.layout["body"]["lower"]["kernel_logs"].update(self.kernel_table)
         else:
-            layout["body"]["lower"]["kernel_logs"].update(Panel("[bold yellow]No kernel error logs found.[/bold yellow]", title="Kernel Error Logs"))
+            self.layout["body"]["lower"]["kernel_logs"].update(self.kernel_empty)
 
         # Middleware Logs
+        _reset_table(self.middleware_table)
+
         middleware_logs = report.get("middleware_logs", {})
         if any(middleware_logs.values()):
-            middleware_logs_table = Table(title="Middleware Error Logs", style="info", box=box.SQUARE, show_lines=True)
-            middleware_logs_table.add_column("Log File", style="dim")
-            middleware_logs_table.add_column("Message", style="bold", overflow="fold", max_width=60)
             for log_file, logs_list in middleware_logs.items():
                 for line in logs_list:
-                    middleware_logs_table.add_row(log_file, line)
-            layout["body"]["lower"]["middleware_logs"].update(middleware_logs_table)
+                    self.middleware_table.add_row(log_file, line)
+            self.layout["body"]["lower"]["middleware_logs"].update(self.middleware_table)
         else:
-            layout["body"]["lower"]["middleware_logs"].update(Panel("[bold yellow]No middleware error logs found.[/bold yellow]", title="Middleware Error Logs"))
+            self.layout["body"]["lower"]["middleware_logs"].update(self.middleware_empty)
 
         # System Logs
+        _reset_table(self.system_table)
+
         system_logs = report.get("system_logs", [])
         if system_logs:
-            system_logs_table = Table(title="System Error Logs", style="info", box=box.SQUARE, show_lines=True)
-            system_logs_table.add_column("Timestamp", style="dim", width=20)
-            system_logs_table.add_column("Message", style="bold", overflow="fold", max_width=60)
             for log in system_logs:
-                timestamp = log.get('timestamp', datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+                timestamp = log.get('timestamp')
+                timestamp = timestamp.strftime(TIMESTAMP_FORMAT) if timestamp is not None else ""
                 message = log.get('message', 'No message')
-                system_logs_table.add_row(timestamp, message)
-            layout["body"]["lower"]["system_logs"].update(system_logs_table)
+                self.system_table.add_row(timestamp, message)
+            self.layout["body"]["lower"]["system_logs"].update(self.system_table)
         else:
-            layout["body"]["lower"]["system_logs"].update(Panel("[bold yellow]No system error logs found.[/bold yellow]", title="System Error Logs"))
-
-        # Footer with instructions
-        footer_text = "Press 'd' to toggle dark/light mode | Press 'Ctrl+C' to exit"
-        layout["footer"].update(Panel(footer_text, style="footer"))
+            self.layout["body"]["lower"]["system_logs"].update(self.system_empty)
 
-    return layout
+def toggle_theme():
+    """
+    Switches between the dark and light themes.
+    """
+    global current_theme
+    with theme_lock:
+        current_theme = "light" if current_theme == "dark" else "dark"
+        theme_name = current_theme
+    # The dashboard applies the new theme when it renders the next frame
+    theme_dirty.set()
+    logger.info(f"Switched to {theme_name.capitalize()} Theme")
 
 def handle_input():
     """
-    Handles non-blocking user input to toggle themes.
+    Waits for key presses on stdin to toggle themes.
     """
-    global current_theme
     try:
-        while True:
-            if keyboard.is_pressed('d'):
-                with theme_lock:
-                    if current_theme == "dark":
-                        console.theme = light_theme
-                        current_theme = "light"
-                        logger.info("Switched to Light Theme")
-                    else:
-                        console.theme = dark_theme
-                        current_theme = "dark"
-                        logger.info("Switched to Dark Theme")
-                # Debounce to prevent rapid toggling
-                time.sleep(0.5)
-            time.sleep(0.1)
-    except KeyboardInterrupt:
-        pass  # Allow graceful exit
+        import termios
+        import tty
+    except ImportError:
+        logger.warning("Theme toggling requires a POSIX terminal.")
+        return
+
+    if not sys.stdin.isatty():
+        return
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        # cbreak delivers keys without Enter while keeping Ctrl+C working
+        tty.setcbreak(fd)
+        while not stop_event.is_set():
+            # Sleep in the kernel until a key arrives; wake up regularly to notice shutdown
+            ready, _, _ = select.select([fd], [], [], 0.5)
+            if ready and os.read(fd, 1) == b'd':
+                toggle_theme()
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _known_unit_files():
+    """
+    Returns the names of all installed unit files, listed in a single query.
+    """
+    manager = _get_manager()
+    if manager is not None:
+        try:
+            with _dbus_lock:
+                unit_files = manager.Manager.ListUnitFiles()
+            return {os.path.basename(path.decode()) for path, _ in unit_files}
+        except Exception as e:
+            logger.exception("Failed to list unit files over D-Bus, falling back to systemctl.")
+
+    result = subprocess.run(
+        ['systemctl', 'list-unit-files', '--no-legend', '--no-pager'],
+        capture_output=True, text=True, timeout=10
+    )
+    return {line.split()[0] for line in result.stdout.splitlines() if line.strip()}
 
 def validate_services(services):
     """
@@ -322,13 +632,36 @@ def validate_services(services):
         logger.warning("Service validation is only supported on Linux systems.")
         return
 
+    try:
+        known = _known_unit_files()
+    except subprocess.TimeoutExpired:
+        logger.error("Timeout while listing unit files to validate services.")
+        return
+    except Exception as e:
+        logger.exception("Error listing unit files to validate services.")
+        return
+
     for service in services:
+        # Instances like getty@tty1.service come from their template unit file;
+        # systemd appends .service to instance names given without a unit type
+        prefix, at, instance = service.partition('@')
+        suffix = instance[instance.rfind('.'):] if '.' in instance else '.service'
+        unit_file = f"{prefix}@{suffix}" if at else service
+        if unit_file not in known:
+            logger.warning(f"Service not found: {service}")
+
+def produce_reports(dashboard, live):
+    """
+    Collects reports in the background and refreshes the dashboard tables in place.
+    """
+    while not stop_event.wait(REFRESH_RATE):
         try:
-            subprocess.run(['systemctl', 'status', service], capture_output=True, text=True, timeout=5)
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout while validating service: {service}")
+            report = generate_system_report(log_limit=LOG_LIMIT)
+            # Live renders under its own lock; hold it so a frame never shows half-updated tables
+            with live._lock:
+                dashboard.update(report)
         except Exception as e:
-            logger.exception(f"Error validating service: {service}")
+            logger.exception("Failed to refresh the dashboard.")
 
 def main():
     # Validate services before starting
@@ -338,13 +671,18 @@ def main():
     input_thread = threading.Thread(target=handle_input, daemon=True)
     input_thread.start()
 
+    dashboard = Dashboard()
+
     try:
-        with Live(console=console, screen=True, auto_refresh=False) as live:
-            while True:
-                report = generate_system_report(log_limit=LOG_LIMIT)
-                dashboard = create_dashboard(report)
-                live.update(dashboard, refresh=True)
-                time.sleep(REFRESH_RATE)
+        dashboard.update(generate_system_report(log_limit=LOG_LIMIT))
+
+        # Rich redraws on its own thread while the producer gathers the next report;
+        # it asks the dashboard for each frame under its lock
+        with Live(console=console, screen=True, auto_refresh=True, get_renderable=dashboard.render,
+                  refresh_per_second=max(1, 1 / REFRESH_RATE)) as live:
+            producer = threading.Thread(target=produce_reports, args=(dashboard, live), daemon=True)
+            producer.start()
+            stop_event.wait()
     except KeyboardInterrupt:
         console.clear()
         print("Exiting dashboard.")
@@ -352,6 +690,10 @@ def main():
         logger.exception("An unexpected error occurred.")
         console.clear()
         print("An unexpected error occurred. Check the log file for details.")
+    finally:
+        # Let the background threads stop and the input thread restore the terminal settings
+        stop_event.set()
+        input_thread.join(timeout=1)
 
 if __name__ == "__main__":
     if platform.system() != "Linux":